@@ -51,7 +51,7 @@ class Base64Decoder:
         self.cache = bytearray()
         self.underlying = underlying
 
-    def write(self, data: bytes) -> int:
+    def write(self, data: "bytes | memoryview") -> int:
         """Takes any input data provided, decodes it as base64, and passes it
         on to the underlying object.  If the data provided is invalid base64
         data, then this method will raise
@@ -129,7 +129,7 @@ class QuotedPrintableDecoder:
         self.cache = b""
         self.underlying = underlying
 
-    def write(self, data: bytes) -> int:
+    def write(self, data: "bytes | memoryview") -> int:
         """Takes any input data provided, decodes it as quoted-printable, and
         passes it on to the underlying object.
 
@@ -142,8 +142,9 @@ class QuotedPrintableDecoder:
         # If the last 2 characters have an '=' sign in it, then we won't be
         # able to decode the encoded value and we'll need to save it for the
         # next decoding step.
-        if data[-2:].find(b"=") != -1:
-            enc, rest = data[:-2], data[-2:]
+        tail = bytes(data[-2:])
+        if tail.find(b"=") != -1:
+            enc, rest = data[:-2], tail
         else:
             enc = data
             rest = b""
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import math
 import os
+import re
 import shutil
 import sys
 import tempfile
@@ -75,6 +77,8 @@ if TYPE_CHECKING:  # pragma: no cover
     class FileProtocol(_FormProtocol, Protocol):
         def __init__(self, file_name: bytes | None, field_name: bytes | None, config: FileConfig) -> None: ...
 
+        def write(self, data: bytes) -> int: ...
+
     OnFieldCallback = Callable[[FieldProtocol], None]
     OnFileCallback = Callable[[FileProtocol], None]
 
@@ -156,12 +160,19 @@ NULL = b"\x00"[0]
 # Mask for ASCII characters that can be http tokens.
 # Per RFC7230 - 3.2.6, this is all alpha-numeric characters
 # and these: !#$%&'*+-.^_`|~
-TOKEN_CHARS_SET = frozenset(
+TOKEN_CHARS = (
     b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
     b"abcdefghijklmnopqrstuvwxyz"
     b"0123456789"
     b"!#$%&'*+-.^_`|~")
 # fmt: on
+TOKEN_CHARS_SET = frozenset(TOKEN_CHARS)
+
+# Matches a complete querystring field - i.e. one that is terminated by an
+# ampersand - along with any separators that come before it.  Like the state
+# machine, this only ends a field at a semicolon when there are no ampersands
+# left, so fields terminated by a semicolon are left to the state machine.
+_QUERYSTRING_FIELD_RE = re.compile(rb"[&;]*([^&;][^&]*)&")
 
 
 def parse_options_header(value: str | bytes | None) -> tuple[bytes, dict[bytes, bytes]]:
@@ -207,6 +218,24 @@ def parse_options_header(value: str | bytes | None) -> tuple[bytes, dict[bytes,
     return ctype, options
 
 
+def _parse_content_type(value: str | bytes) -> tuple[str, bytes | None]:
+    """Parses a Content-Type header into its value (as a string) and boundary,
+    if any.
+    """
+    content_type, params = parse_options_header(value)
+    return content_type.decode("latin-1"), params.get(b"boundary")
+
+
+def _get_header(headers: dict[str, bytes], name: str) -> bytes | None:
+    """Looks up a header by name, falling back to the lowercase form of the
+    name (as used by e.g. ASGI servers) if it's not present as given.
+    """
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
 class Field:
     """A Field object represents a (parsed) form field.  It represents a single
     field with a corresponding name and value.
@@ -515,14 +544,14 @@ class File:
         self._actual_file_name = fname
         return tmp_file
 
-    def write(self, data: bytes) -> int:
+    def write(self, data: bytes | memoryview) -> int:
         """Write some data to the File.
 
-        :param data: a bytestring
+        :param data: a bytestring, or a memoryview over one
         """
         return self.on_data(data)
 
-    def on_data(self, data: bytes) -> int:
+    def on_data(self, data: bytes | memoryview) -> int:
         """This method is a callback that will be called whenever data is
         written to the File.
 
@@ -597,6 +626,23 @@ class BaseParser:
     def __init__(self) -> None:
         self.logger = logging.getLogger(__name__)
         self.callbacks: QuerystringCallbacks | OctetStreamCallbacks | MultipartCallbacks = {}
+        self._current_size = 0
+        self._max_size: int | float = float("inf")
+        self._remaining = sys.maxsize
+
+    @property
+    def max_size(self) -> int | float:
+        """The maximum size of body to parse."""
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int | float) -> None:
+        self._max_size = value
+        # Keep track of how many more bytes we may accept, so that writes only
+        # need to clamp their length against it.  A NaN limit never compares
+        # as exceeded, so like infinity it leaves the body unbounded.
+        unbounded = math.isinf(value) or math.isnan(value)
+        self._remaining = (sys.maxsize if unbounded else int(value)) - self._current_size
 
     def callback(
         self, name: CallbackName, data: bytes | None = None, start: int | None = None, end: int | None = None
@@ -622,10 +668,8 @@ class BaseParser:
             if start is not None and start == end:
                 return
 
-            self.logger.debug("Calling %s with data[%d:%d]", on_name, start, end)
             func(data, start, end)
         else:
-            self.logger.debug("Calling %s with no data", on_name)
             func()
 
     def set_callback(self, name: CallbackName, new_func: Callable[..., Any] | None) -> None:
@@ -643,6 +687,13 @@ class BaseParser:
         else:
             self.callbacks["on_" + name] = new_func  # type: ignore[literal-required]
 
+    def reset(self) -> None:
+        """Reset this parser so that it can parse a new body.  The callbacks
+        and maximum size are kept.
+        """
+        self._current_size = 0
+        self.max_size = self._max_size
+
     def close(self) -> None:
         pass  # pragma: no cover
 
@@ -675,8 +726,7 @@ class OctetStreamParser(BaseParser):
 
         if not isinstance(max_size, Number) or max_size < 1:
             raise ValueError("max_size must be a positive number, not %r" % max_size)
-        self.max_size: int | float = max_size
-        self._current_size = 0
+        self.max_size = max_size
 
     def write(self, data: bytes) -> int:
         """Write some data to the parser, which will perform size verification,
@@ -693,24 +743,28 @@ class OctetStreamParser(BaseParser):
             self._started = True
 
         # Truncate data length.
-        data_len = len(data)
-        if (self._current_size + data_len) > self.max_size:
+        data_len = min(len(data), self._remaining)
+        if data_len != len(data):
             # We truncate the length of data that we are to process.
-            new_size = int(self.max_size - self._current_size)
             self.logger.warning(
                 "Current size is %d (max %d), so truncating data length from %d to %d",
                 self._current_size,
                 self.max_size,
+                len(data),
                 data_len,
-                new_size,
             )
-            data_len = new_size
 
         # Increment size, then callback, in case there's an exception.
         self._current_size += data_len
+        self._remaining -= data_len
         self.callback("data", data, 0, data_len)
         return data_len
 
+    def reset(self) -> None:
+        """Reset this parser so that it can parse a new body."""
+        super().reset()
+        self._started = False
+
     def finalize(self) -> None:
         """Finalize this parser, which signals to that we are finished parsing,
         and sends the on_end callback.
@@ -744,6 +798,7 @@ class QuerystringParser(BaseParser):
     """  # noqa: E501
 
     state: QuerystringState
+    callbacks: QuerystringCallbacks
 
     def __init__(
         self, callbacks: QuerystringCallbacks = {}, strict_parsing: bool = False, max_size: float = float("inf")
@@ -757,8 +812,7 @@ class QuerystringParser(BaseParser):
         # Max-size stuff
         if not isinstance(max_size, Number) or max_size < 1:
             raise ValueError("max_size must be a positive number, not %r" % max_size)
-        self.max_size: int | float = max_size
-        self._current_size = 0
+        self.max_size = max_size
 
         # Should parsing be strict?
         self.strict_parsing = strict_parsing
@@ -778,24 +832,23 @@ class QuerystringParser(BaseParser):
             The number of bytes written.
         """
         # Handle sizing.
-        data_len = len(data)
-        if (self._current_size + data_len) > self.max_size:
+        data_len = min(len(data), self._remaining)
+        if data_len != len(data):
             # We truncate the length of data that we are to process.
-            new_size = int(self.max_size - self._current_size)
             self.logger.warning(
                 "Current size is %d (max %d), so truncating data length from %d to %d",
                 self._current_size,
                 self.max_size,
+                len(data),
                 data_len,
-                new_size,
             )
-            data_len = new_size
 
         l = 0
         try:
             l = self._internal_write(data, data_len)
         finally:
             self._current_size += l
+            self._remaining -= l
 
         return l
 
@@ -804,7 +857,48 @@ class QuerystringParser(BaseParser):
         strict_parsing = self.strict_parsing
         found_sep = self._found_sep
 
+        # Look up our callbacks once, instead of once per event.
+        on_field_start = self.callbacks.get("on_field_start")
+        on_field_name = self.callbacks.get("on_field_name")
+        on_field_data = self.callbacks.get("on_field_data")
+        on_field_end = self.callbacks.get("on_field_end")
+
         i = 0
+
+        # If we're between fields and aren't parsing strictly, we can let a
+        # regular expression tokenize every complete field at the start of this
+        # chunk, which is a lot faster than going through them one state at a
+        # time.  The state machine below takes care of whatever is left, which
+        # is at most a single unterminated field.  Note that we match at each
+        # position rather than searching, so that an unterminated field is only
+        # scanned once.
+        if state == QuerystringState.BEFORE_FIELD and not strict_parsing:
+            match = _QUERYSTRING_FIELD_RE.match(data, 0, length)
+            while match is not None:
+                start, end = match.span(1)
+                if on_field_start is not None:
+                    on_field_start()
+
+                equals_pos = data.find(b"=", start, end)
+                if equals_pos == -1:
+                    # No equals sign, so the whole thing is a name without
+                    # any data.
+                    if on_field_name is not None:
+                        on_field_name(data, start, end)
+                else:
+                    if on_field_name is not None and start != equals_pos:
+                        on_field_name(data, start, equals_pos)
+                    if on_field_data is not None and equals_pos + 1 != end:
+                        on_field_data(data, equals_pos + 1, end)
+
+                if on_field_end is not None:
+                    on_field_end()
+
+                # The match ends with the separator after this field.
+                i = match.end()
+                found_sep = True
+                match = _QUERYSTRING_FIELD_RE.match(data, i, length)
+
         while i < length:
             ch = data[i]
 
@@ -834,7 +928,8 @@ class QuerystringParser(BaseParser):
                     # Emit a field-start event, and go to that state.  Also,
                     # reset the "found_sep" flag, for the next time we get to
                     # this state.
-                    self.callback("field_start")
+                    if on_field_start is not None:
+                        on_field_start()
                     i -= 1
                     state = QuerystringState.FIELD_NAME
                     found_sep = False
@@ -856,7 +951,8 @@ class QuerystringParser(BaseParser):
 
                 if equals_pos != -1:
                     # Emit this name.
-                    self.callback("field_name", data, i, equals_pos)
+                    if on_field_name is not None and i != equals_pos:
+                        on_field_name(data, i, equals_pos)
 
                     # Jump i to this position.  Note that it will then have 1
                     # added to it below, which means the next iteration of this
@@ -871,15 +967,18 @@ class QuerystringParser(BaseParser):
                         # end - there's no data callback at all (not even with
                         # a blank value).
                         if sep_pos != -1:
-                            self.callback("field_name", data, i, sep_pos)
-                            self.callback("field_end")
+                            if on_field_name is not None and i != sep_pos:
+                                on_field_name(data, i, sep_pos)
+                            if on_field_end is not None:
+                                on_field_end()
 
                             i = sep_pos - 1
                             state = QuerystringState.BEFORE_FIELD
                         else:
                             # Otherwise, no separator in this block, so the
                             # rest of this chunk must be a name.
-                            self.callback("field_name", data, i, length)
+                            if on_field_name is not None and i != length:
+                                on_field_name(data, i, length)
                             i = length
 
                     else:
@@ -896,7 +995,8 @@ class QuerystringParser(BaseParser):
 
                         # No separator in the rest of this chunk, so it's just
                         # a field name.
-                        self.callback("field_name", data, i, length)
+                        if on_field_name is not None and i != length:
+                            on_field_name(data, i, length)
                         i = length
 
             elif state == QuerystringState.FIELD_DATA:
@@ -909,8 +1009,10 @@ class QuerystringParser(BaseParser):
                 # If we found it, callback this bit as data and then go back
                 # to expecting to find a field.
                 if sep_pos != -1:
-                    self.callback("field_data", data, i, sep_pos)
-                    self.callback("field_end")
+                    if on_field_data is not None and i != sep_pos:
+                        on_field_data(data, i, sep_pos)
+                    if on_field_end is not None:
+                        on_field_end()
 
                     # Note that we go to the separator, which brings us to the
                     # "before field" state.  This allows us to properly emit
@@ -921,7 +1023,8 @@ class QuerystringParser(BaseParser):
 
                 # Otherwise, emit the rest as data and finish.
                 else:
-                    self.callback("field_data", data, i, length)
+                    if on_field_data is not None and i != length:
+                        on_field_data(data, i, length)
                     i = length
 
             else:  # pragma: no cover (error case)
@@ -937,6 +1040,12 @@ class QuerystringParser(BaseParser):
         self._found_sep = found_sep
         return len(data)
 
+    def reset(self) -> None:
+        """Reset this parser so that it can parse a new body."""
+        super().reset()
+        self.state = QuerystringState.BEFORE_FIELD
+        self._found_sep = False
+
     def finalize(self) -> None:
         """Finalize this parser, which signals to that we are finished parsing,
         if we're still in the middle of a field, an on_field_end callback, and
@@ -974,6 +1083,8 @@ class MultipartParser(BaseParser):
         max_size: The maximum size of body to parse.  Defaults to infinity - i.e. unbounded.
     """  # noqa: E501
 
+    callbacks: MultipartCallbacks
+
     def __init__(
         self, boundary: bytes | str, callbacks: MultipartCallbacks = {}, max_size: float = float("inf")
     ) -> None:
@@ -987,7 +1098,6 @@ class MultipartParser(BaseParser):
         if not isinstance(max_size, Number) or max_size < 1:
             raise ValueError("max_size must be a positive number, not %r" % max_size)
         self.max_size = max_size
-        self._current_size = 0
 
         # Setup marks.  These are used to track the state of data received.
         self.marks: dict[str, int] = {}
@@ -996,6 +1106,12 @@ class MultipartParser(BaseParser):
         if isinstance(boundary, str):  # pragma: no cover
             boundary = boundary.encode("latin-1")
         self.boundary = b"\r\n--" + boundary
+        self._boundary_length = len(self.boundary)
+
+        # Look-behind buffers for data that turned out not to be a boundary,
+        # depending on how far through a part or last boundary we got.
+        self._part_boundary_lookback = self.boundary + b"\r\n"
+        self._last_boundary_lookback = self.boundary + b"--\r\n"
 
     def write(self, data: bytes) -> int:
         """Write some data to the parser, which will perform size verification,
@@ -1012,30 +1128,34 @@ class MultipartParser(BaseParser):
             The number of bytes written.
         """
         # Handle sizing.
-        data_len = len(data)
-        if (self._current_size + data_len) > self.max_size:
+        data_len = min(len(data), self._remaining)
+        if data_len != len(data):
             # We truncate the length of data that we are to process.
-            new_size = int(self.max_size - self._current_size)
             self.logger.warning(
                 "Current size is %d (max %d), so truncating data length from %d to %d",
                 self._current_size,
                 self.max_size,
+                len(data),
                 data_len,
-                new_size,
             )
-            data_len = new_size
 
         l = 0
         try:
             l = self._internal_write(data, data_len)
         finally:
             self._current_size += l
+            self._remaining -= l
 
         return l
 
     def _internal_write(self, data: bytes, length: int) -> int:
         # Get values from locals.
         boundary = self.boundary
+        boundary_length = self._boundary_length
+
+        # Bind the characters we compare against to locals (shadowing the
+        # module-level constants of the same names), too.
+        CR, LF, SPACE, HYPHEN = b"\r\n -"
 
         # Get our state, flags and index.  These are persisted between calls to
         # this function.
@@ -1043,6 +1163,17 @@ class MultipartParser(BaseParser):
         index = self.index
         flags = self.flags
 
+        # Look up our callbacks once, instead of once per event.
+        on_part_begin = self.callbacks.get("on_part_begin")
+        on_part_data = self.callbacks.get("on_part_data")
+        on_part_end = self.callbacks.get("on_part_end")
+        on_header_begin = self.callbacks.get("on_header_begin")
+        on_header_field = self.callbacks.get("on_header_field")
+        on_header_value = self.callbacks.get("on_header_value")
+        on_header_end = self.callbacks.get("on_header_end")
+        on_headers_finished = self.callbacks.get("on_headers_finished")
+        on_end = self.callbacks.get("on_end")
+
         # Our index defaults to 0.
         i = 0
 
@@ -1059,38 +1190,38 @@ class MultipartParser(BaseParser):
         # end of the buffer, and reset the mark, instead of deleting it.  This
         # is used at the end of the function to call our callbacks with any
         # remaining data in this chunk.
-        def data_callback(name: CallbackName, end_i: int, remaining: bool = False) -> None:
+        def data_callback(
+            name: str, func: Callable[[bytes, int, int], None] | None, end_i: int, remaining: bool = False
+        ) -> None:
             marked_index = self.marks.get(name)
             if marked_index is None:
                 return
 
             # Otherwise, we call it from the mark to the current byte we're
             # processing.
-            if end_i <= marked_index:
-                # There is no additional data to send.
+            if end_i <= marked_index or func is None:
+                # There is no additional data to send, or no one to send it to.
                 pass
             elif marked_index >= 0:
                 # We are emitting data from the local buffer.
-                self.callback(name, data, marked_index, end_i)
+                func(data, marked_index, end_i)
             else:
                 # Some of the data comes from a partial boundary match.
                 # and requires look-behind.
                 # We need to use self.flags (and not flags) because we care about
                 # the state when we entered the loop.
                 lookbehind_len = -marked_index
-                if lookbehind_len <= len(boundary):
-                    self.callback(name, boundary, 0, lookbehind_len)
+                if lookbehind_len <= boundary_length:
+                    func(boundary, 0, lookbehind_len)
                 elif self.flags & FLAG_PART_BOUNDARY:
-                    lookback = boundary + b"\r\n"
-                    self.callback(name, lookback, 0, lookbehind_len)
+                    func(self._part_boundary_lookback, 0, lookbehind_len)
                 elif self.flags & FLAG_LAST_BOUNDARY:
-                    lookback = boundary + b"--\r\n"
-                    self.callback(name, lookback, 0, lookbehind_len)
+                    func(self._last_boundary_lookback, 0, lookbehind_len)
                 else:  # pragma: no cover (error case)
                     self.logger.warning("Look-back buffer error")
 
                 if end_i > 0:
-                    self.callback(name, data, 0, end_i)
+                    func(data, 0, end_i)
             # If we're getting remaining data, we have got all the data we
             # can be certain is not a boundary, leaving only a partial boundary match.
             if remaining:
@@ -1103,10 +1234,11 @@ class MultipartParser(BaseParser):
             c = data[i]
 
             if state == MultipartState.START:
-                # Skip leading newlines
-                if c == CR or c == LF:
+                # Skip leading newlines, all of them at once.
+                while i < length and (data[i] == CR or data[i] == LF):
                     i += 1
-                    continue
+                if i == length:
+                    break
 
                 # index is used as in index into our boundary.  Set to 0.
                 index = 0
@@ -1119,7 +1251,7 @@ class MultipartParser(BaseParser):
             elif state == MultipartState.START_BOUNDARY:
                 # Check to ensure that the last 2 characters in our boundary
                 # are CRLF.
-                if index == len(boundary) - 2:
+                if index == boundary_length - 2:
                     if c == HYPHEN:
                         # Potential empty message.
                         state = MultipartState.END_BOUNDARY
@@ -1133,7 +1265,7 @@ class MultipartParser(BaseParser):
 
                     index += 1
 
-                elif index == len(boundary) - 2 + 1:
+                elif index == boundary_length - 1:
                     if c != LF:
                         msg = "Did not find LF at end of boundary (%d)" % (i,)
                         self.logger.warning(msg)
@@ -1145,7 +1277,8 @@ class MultipartParser(BaseParser):
                     index = 0
 
                     # Callback for the start of a part.
-                    self.callback("part_begin")
+                    if on_part_begin is not None:
+                        on_part_begin()
 
                     # Move to the next character and state.
                     state = MultipartState.HEADER_FIELD_START
@@ -1174,8 +1307,8 @@ class MultipartParser(BaseParser):
                 # not a CR; a CR at the beginning of the header will cause us
                 # to stop parsing headers in the MultipartState.HEADER_FIELD state,
                 # below.
-                if c != CR:
-                    self.callback("header_begin")
+                if c != CR and on_header_begin is not None:
+                    on_header_begin()
 
                 # Move to parsing header fields.
                 state = MultipartState.HEADER_FIELD
@@ -1191,37 +1324,52 @@ class MultipartParser(BaseParser):
                     i += 1
                     continue
 
-                # Increment our index in the header.
-                index += 1
+                # Jump to the colon that ends this header, and check all of the
+                # characters before it at once.  Deleting every valid token
+                # character leaves nothing behind unless one is invalid.
+                colon = data.find(b":", i, length)
+                end = length if colon == -1 else colon
+                if data[i:end].translate(None, TOKEN_CHARS):
+                    # Find the invalid character, so we can report where it is.
+                    while data[i] in TOKEN_CHARS_SET:
+                        i += 1
+                    msg = "Found invalid character %r in header at %d" % (data[i], i)
+                    self.logger.warning(msg)
+                    e = MultipartParseError(msg)
+                    e.offset = i
+                    raise e
 
-                # If we've reached a colon, we're done with this header.
-                if c == COLON:
-                    # A 0-length header is an error.
-                    if index == 1:
-                        msg = "Found 0-length header at %d" % (i,)
-                        self.logger.warning(msg)
-                        e = MultipartParseError(msg)
-                        e.offset = i
-                        raise e
+                # Keep track of the length of the header in our index.
+                index += end - i
 
-                    # Call our callback with the header field.
-                    data_callback("header_field", i)
+                # If there's no colon, the header continues in the next chunk.
+                if colon == -1:
+                    i = length
+                    break
 
-                    # Move to parsing the header value.
-                    state = MultipartState.HEADER_VALUE_START
+                # Otherwise, we're done with this header.
+                i = colon
 
-                elif c not in TOKEN_CHARS_SET:
-                    msg = "Found invalid character %r in header at %d" % (c, i)
+                # A 0-length header is an error.
+                if index == 0:
+                    msg = "Found 0-length header at %d" % (i,)
                     self.logger.warning(msg)
                     e = MultipartParseError(msg)
                     e.offset = i
                     raise e
 
+                # Call our callback with the header field.
+                data_callback("header_field", on_header_field, i)
+
+                # Move to parsing the header value.
+                state = MultipartState.HEADER_VALUE_START
+
             elif state == MultipartState.HEADER_VALUE_START:
-                # Skip leading spaces.
-                if c == SPACE:
+                # Skip leading spaces, all of them at once.
+                while i < length and data[i] == SPACE:
                     i += 1
-                    continue
+                if i == length:
+                    break
 
                 # Mark the start of the header value.
                 set_mark("header_value")
@@ -1231,12 +1379,17 @@ class MultipartParser(BaseParser):
                 i -= 1
 
             elif state == MultipartState.HEADER_VALUE:
-                # If we've got a CR, we're nearly done our headers.  Otherwise,
-                # we do nothing and just move past this character.
-                if c == CR:
-                    data_callback("header_value", i)
-                    self.callback("header_end")
-                    state = MultipartState.HEADER_VALUE_ALMOST_DONE
+                # Jump to the CR that nearly ends our header.  If there isn't
+                # one, the whole rest of this chunk is part of the value.
+                i = data.find(b"\r", i, length)
+                if i == -1:
+                    i = length
+                    break
+
+                data_callback("header_value", on_header_value, i)
+                if on_header_end is not None:
+                    on_header_end()
+                state = MultipartState.HEADER_VALUE_ALMOST_DONE
 
             elif state == MultipartState.HEADER_VALUE_ALMOST_DONE:
                 # The last character should be a LF.  If not, it's an error.
@@ -1263,7 +1416,8 @@ class MultipartParser(BaseParser):
                     e.offset = i
                     raise e
 
-                self.callback("headers_finished")
+                if on_headers_finished is not None:
+                    on_headers_finished()
                 state = MultipartState.PART_DATA_START
 
             elif state == MultipartState.PART_DATA_START:
@@ -1284,7 +1438,6 @@ class MultipartParser(BaseParser):
                 prev_index = index
 
                 # Set up variables.
-                boundary_length = len(boundary)
                 data_length = length
 
                 # If our index is 0, we're starting a new part, so start our
@@ -1295,23 +1448,38 @@ class MultipartParser(BaseParser):
                     # Calling `find` is much faster than iterating here.
                     i0 = data.find(boundary, i, data_length)
                     if i0 >= 0:
-                        # We matched the whole boundary string.
-                        index = boundary_length - 1
-                        i = i0 + boundary_length - 1
-                    else:
-                        # No match found for whole string.
-                        # There may be a partial boundary at the end of the
-                        # data, which the find will not match.
-                        # Since the length should to be searched is limited to
-                        # the boundary length, just perform a naive search.
-                        i = max(i, data_length - boundary_length)
-
-                        # Search forward until we either hit the end of our buffer,
-                        # or reach a potential start of the boundary.
-                        while i < data_length - 1 and data[i] != boundary[0]:
-                            i += 1
-
-                    c = data[i]
+                        # We matched the whole boundary string, so there is no
+                        # need to walk through it byte by byte.  Continue with
+                        # the byte right after it, which decides whether this
+                        # is a part boundary or the last boundary.
+                        index = boundary_length
+                        i = i0 + boundary_length
+                        continue
+
+                    # No match found for whole string.
+                    # There may be a partial boundary at the end of the
+                    # data, which the find will not match.
+                    # Since the length should to be searched is limited to
+                    # the boundary length, just perform a naive search.
+                    i = max(i, data_length - boundary_length)
+
+                    # Look for a potential start of the boundary such that
+                    # everything from it to the end of the buffer is a prefix
+                    # of the boundary.  If we find one, we already know how
+                    # much of the boundary we've matched, so there's no need
+                    # to walk through it byte by byte.
+                    while True:
+                        i = data.find(boundary[0], i, data_length)
+                        if i == -1:
+                            break
+                        if boundary.startswith(data[i:data_length]):
+                            index = data_length - i
+                            break
+                        i += 1
+
+                    # Either way, we're done with this buffer.
+                    i = data_length
+                    continue
 
                 # Now, we have a couple of cases here.  If our index is before
                 # the end of the boundary...
@@ -1355,11 +1523,13 @@ class MultipartParser(BaseParser):
                             flags &= ~FLAG_PART_BOUNDARY
 
                             # We have identified a boundary, callback for any data before it.
-                            data_callback("part_data", i - index)
+                            data_callback("part_data", on_part_data, i - index)
                             # Callback indicating that we've reached the end of
                             # a part, and are starting a new one.
-                            self.callback("part_end")
-                            self.callback("part_begin")
+                            if on_part_end is not None:
+                                on_part_end()
+                            if on_part_begin is not None:
+                                on_part_begin()
 
                             # Move to parsing new headers.
                             index = 0
@@ -1378,11 +1548,13 @@ class MultipartParser(BaseParser):
                         # We need a second hyphen here.
                         if c == HYPHEN:
                             # We have identified a boundary, callback for any data before it.
-                            data_callback("part_data", i - index)
+                            data_callback("part_data", on_part_data, i - index)
                             # Callback to end the current part, and then the
                             # message.
-                            self.callback("part_end")
-                            self.callback("end")
+                            if on_part_end is not None:
+                                on_part_end()
+                            if on_end is not None:
+                                on_end()
                             state = MultipartState.END
                         else:
                             # No match, so reset index.
@@ -1401,7 +1573,7 @@ class MultipartParser(BaseParser):
                     i -= 1
 
             elif state == MultipartState.END_BOUNDARY:
-                if index == len(boundary) - 2 + 1:
+                if index == boundary_length - 1:
                     if c != HYPHEN:
                         msg = "Did not find - at end of boundary (%d)" % (i,)
                         self.logger.warning(msg)
@@ -1409,7 +1581,8 @@ class MultipartParser(BaseParser):
                         e.offset = i
                         raise e
                     index += 1
-                    self.callback("end")
+                    if on_end is not None:
+                        on_end()
                     state = MultipartState.END
 
             elif state == MultipartState.END:
@@ -1441,9 +1614,9 @@ class MultipartParser(BaseParser):
         # that we haven't yet reached the end of this 'thing'.  So, by setting
         # the mark to 0, we cause any data callbacks that take place in future
         # calls to this function to start from the beginning of that buffer.
-        data_callback("header_field", length, True)
-        data_callback("header_value", length, True)
-        data_callback("part_data", length - index, True)
+        data_callback("header_field", on_header_field, length, True)
+        data_callback("header_value", on_header_value, length, True)
+        data_callback("part_data", on_part_data, length - index, True)
 
         # Save values to locals.
         self.state = state
@@ -1454,6 +1627,15 @@ class MultipartParser(BaseParser):
         # all of it.
         return length
 
+    def reset(self) -> None:
+        """Reset this parser so that it can parse a new body.  The boundary and
+        its look-behind buffers are kept.
+        """
+        super().reset()
+        self.state = MultipartState.START
+        self.index = self.flags = 0
+        self.marks = {}
+
     def finalize(self) -> None:
         """Finalize this parser, which signals to that we are finished parsing.
 
@@ -1550,22 +1732,42 @@ class FormParser:
 
         parser: OctetStreamParser | MultipartParser | QuerystringParser | None = None
 
+        # The built-in File copies whatever it's given, so it can be handed a
+        # view of each chunk rather than a copy of it.  Custom file classes are
+        # documented to receive bytestrings, and may hold on to them.
+        file_views = FileClass is File
+
         # Depending on the Content-Type, we instantiate the correct parser.
         if content_type == "application/octet-stream":
             file: FileProtocol = None  # type: ignore
+            file_open = False
+
+            def reset_state() -> None:
+                nonlocal file, file_open
+                # Close a file we didn't get to the end of, rather than leaving
+                # it (and any temporary file) for the garbage collector.
+                if file_open:
+                    file.close()
+                file = None  # type: ignore
+                file_open = False
 
             def on_start() -> None:
-                nonlocal file
+                nonlocal file, file_open
                 file = FileClass(file_name, None, config=cast("FileConfig", self.config))
+                file_open = True
 
             def on_data(data: bytes, start: int, end: int) -> None:
                 nonlocal file
-                file.write(data[start:end])
+                if file_views:
+                    cast(File, file).write(memoryview(data)[start:end])
+                else:
+                    file.write(data[start:end])
 
             def _on_end() -> None:
-                nonlocal file
+                nonlocal file, file_open
                 # Finalize the file itself.
                 file.finalize()
+                file_open = False
 
                 # Call our callback.
                 if on_file:
@@ -1586,6 +1788,13 @@ class FormParser:
 
             f: FieldProtocol | None = None
 
+            def reset_state() -> None:
+                nonlocal f
+                del name_buffer[:]
+                if f is not None:
+                    f.close()
+                f = None
+
             def on_field_start() -> None:
                 pass
 
@@ -1642,6 +1851,20 @@ class FormParser:
             f_multi: FileProtocol | FieldProtocol | None = None
             writer = None
             is_file = False
+            part_open = False
+
+            def reset_state() -> None:
+                nonlocal headers, f_multi, writer, is_file, part_open
+                del header_name[:]
+                del header_value[:]
+                headers = {}
+                # Close a part we didn't get to the end of, rather than leaving
+                # it (and any temporary file) for the garbage collector.
+                if part_open:
+                    assert f_multi is not None
+                    f_multi.close()
+                f_multi = writer = None
+                is_file = part_open = False
 
             def on_part_begin() -> None:
                 # Reset headers in case this isn't the first part.
@@ -1651,13 +1874,19 @@ class FormParser:
             def on_part_data(data: bytes, start: int, end: int) -> None:
                 nonlocal writer
                 assert writer is not None
-                writer.write(data[start:end])
+                # Fields, and custom file classes, may hold on to the data they
+                # receive, so only the built-in File is handed a view.
+                if is_file and file_views:
+                    writer.write(memoryview(data)[start:end])
+                else:
+                    writer.write(data[start:end])
                 # TODO: check for error here.
 
             def on_part_end() -> None:
-                nonlocal f_multi, is_file
+                nonlocal f_multi, is_file, part_open
                 assert f_multi is not None
                 f_multi.finalize()
+                part_open = False
                 if is_file:
                     if on_file:
                         on_file(f_multi)
@@ -1677,7 +1906,7 @@ class FormParser:
                 del header_value[:]
 
             def on_headers_finished() -> None:
-                nonlocal is_file, f_multi, writer
+                nonlocal is_file, f_multi, writer, part_open
                 # Reset the 'is file' flag.
                 is_file = False
 
@@ -1697,6 +1926,7 @@ class FormParser:
                 else:
                     f_multi = FileClass(file_name, field_name, config=cast("FileConfig", self.config))
                     is_file = True
+                part_open = True
 
                 # Parse the given Content-Transfer-Encoding to determine what
                 # we need to do with the incoming data.
@@ -1749,6 +1979,7 @@ class FormParser:
             raise FormParserError("Unknown Content-Type: {}".format(content_type))
 
         self.parser = parser
+        self._reset_state = reset_state
 
     def write(self, data: bytes) -> int:
         """Write some data.  The parser will forward this to the appropriate
@@ -1765,6 +1996,16 @@ class FormParser:
         assert self.parser is not None
         return self.parser.write(data)
 
+    def reset(self) -> None:
+        """Reset the parser so that it can parse a new request body with the
+        same Content-Type and boundary.  Any field or file that was still being
+        parsed is closed and dropped.
+        """
+        self.bytes_received = 0
+        self._reset_state()
+        assert self.parser is not None
+        self.parser.reset()
+
     def finalize(self) -> None:
         """Finalize the parser."""
         if self.parser is not None and hasattr(self.parser, "finalize"):
@@ -1793,28 +2034,31 @@ def create_form_parser(
     parser.
 
     Args:
-        headers: A dictionary-like object of HTTP headers.  The only required header is Content-Type.
+        headers: A dictionary-like object of HTTP headers.  The only required header is Content-Type.  Header
+            names may be given either as shown or in lowercase.
         on_field: Callback to call with each parsed field.
         on_file: Callback to call with each parsed file.
         trust_x_headers: Whether or not to trust information received from certain X-Headers - for example, the file
             name from X-File-Name.
         config: Configuration variables to pass to the FormParser.
     """
-    content_type: str | bytes | None = headers.get("Content-Type")
+    content_type: str | bytes | None = _get_header(headers, "Content-Type")
     if content_type is None:
         logging.getLogger(__name__).warning("No Content-Type header given")
         raise ValueError("No Content-Type header given!")
 
     # Boundaries are optional (the FormParser will raise if one is needed
-    # but not given).
-    content_type, params = parse_options_header(content_type)
-    boundary = params.get(b"boundary")
-
-    # We need content_type to be a string, not a bytes object.
-    content_type = content_type.decode("latin-1")
+    # but not given).  The most common kind of form has no parameters at all,
+    # so don't bother parsing its Content-Type.
+    if content_type == b"application/x-www-form-urlencoded":
+        content_type, boundary = "application/x-www-form-urlencoded", None
+    else:
+        content_type, boundary = _parse_content_type(content_type)
 
-    # File names are optional.
-    file_name = headers.get("X-File-Name")
+    # File names are optional, and only used for octet-stream bodies.
+    file_name = None
+    if content_type == "application/octet-stream":
+        file_name = _get_header(headers, "X-File-Name")
 
     # Instantiate a form parser.
     form_parser = FormParser(content_type, on_field, on_file, boundary=boundary, file_name=file_name, config=config)
@@ -1836,8 +2080,10 @@ def parse_form(
     callbacks that will get called whenever a field or file is parsed.
 
     Args:
-        headers: A dictionary-like object of HTTP headers.  The only required header is Content-Type.
+        headers: A dictionary-like object of HTTP headers.  The only required header is Content-Type.  Header
+            names may be given either as shown or in lowercase.
         input_stream: A file-like object that represents the request body. The read() method must return bytestrings.
+            If the object also has a readinto() method, it is used instead of read().
         on_field: Callback to call with each parsed field.
         on_file: Callback to call with each parsed file.
         chunk_size: The maximum size to read from the input stream and write to the parser at one time.
@@ -1846,28 +2092,69 @@ def parse_form(
     # Create our form parser.
     parser = create_form_parser(headers, on_field, on_file)
 
-    # Read chunks of 1MiB and write to the parser, but never read more than
-    # the given Content-Length, if any.
-    content_length: int | float | bytes | None = headers.get("Content-Length")
-    if content_length is not None:
-        content_length = int(content_length)
+    # Never read more than the given Content-Length, if any.
+    content_length = _get_header(headers, "Content-Length")
+    remaining = -1 if content_length is None else int(content_length)
+    if 0 <= remaining < chunk_size:
+        chunk_size = remaining
+
+    # Streams may return less than we ask for before they're exhausted (e.g.
+    # when backed by a socket), so keep reading until we've got as much as we
+    # asked for or the stream has nothing left.  This way we don't end early,
+    # and don't make the parser handle lots of tiny chunks.  If we can, we read
+    # into a single buffer that we reuse for every chunk, rather than having
+    # the stream allocate a new bytestring each time.
+    read: Callable[[int], bytes | bytearray]
+    readinto = getattr(input_stream, "readinto", None)
+    if readinto is None:
+
+        def read(size: int) -> bytes | bytearray:
+            buff = input_stream.read(size)
+            if len(buff) == size or not buff:
+                return buff
+
+            staging = bytearray(buff)
+            while len(staging) < size:
+                buff = input_stream.read(size - len(staging))
+                if not buff:
+                    break
+                staging += buff
+            return staging
+
     else:
-        content_length = float("inf")
-    bytes_read = 0
-
-    while True:
-        # Read only up to the Content-Length given.
-        max_readable = int(min(content_length - bytes_read, chunk_size))
-        buff = input_stream.read(max_readable)
-
-        # Write to the parser and update our length.
-        parser.write(buff)
-        bytes_read += len(buff)
-
-        # If we get a buffer that's smaller than the size requested, or if we
-        # have read up to our content length, we're done.
-        if len(buff) != max_readable or bytes_read == content_length:
-            break
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+
+        def read(size: int) -> bytearray:
+            n = 0
+            while n < size:
+                read_size = readinto(view[n:size])
+                if not read_size:
+                    break
+                n += read_size
+            return buffer if n == chunk_size else buffer[:n]
+
+    # Read chunks of 1MiB and write to the parser.  The parsers work just as
+    # well on a bytearray as on a bytestring.  If we get a buffer that's
+    # smaller than the size requested, we've reached the end of the stream.
+    if remaining == chunk_size:
+        # The whole body fits in a single chunk.
+        parser.write(cast(bytes, read(remaining)))
+    elif content_length is None:
+        while True:
+            buff = read(chunk_size)
+            parser.write(cast(bytes, buff))
+            if len(buff) != chunk_size:
+                break
+    else:
+        while True:
+            # Read only up to the Content-Length given.
+            max_readable = min(remaining, chunk_size)
+            buff = read(max_readable)
+            parser.write(cast(bytes, buff))
+            remaining -= len(buff)
+            if len(buff) != max_readable or remaining == 0:
+                break
 
     # Tell our parser that we're done writing data.
     parser.finalize()
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import functools
 import os
-import re
+import string
 import sys
 import types
 from typing import TYPE_CHECKING
@@ -18,88 +17,94 @@ def ensure_in_path(path: str) -> None:
     if not os.path.isdir(path):
         raise RuntimeError("Tried to add nonexisting path")
 
-    def _samefile(x: str, y: str) -> bool:
+    # Normalize the path we're looking for once, rather than for every entry.
+    normalized = os.path.abspath(path).lower()
+
+    def _samefile(x: str) -> bool:
         try:
-            return os.path.samefile(x, y)
+            return os.path.samefile(x, path)
         except OSError:
             return False
         except AttributeError:
             # Probably on Windows.
-            path1 = os.path.abspath(x).lower()
-            path2 = os.path.abspath(y).lower()
-            return path1 == path2
+            return os.path.abspath(x).lower() == normalized
 
-    # Remove existing copies of it.
-    for pth in sys.path:
-        if _samefile(pth, path):
-            sys.path.remove(pth)
+    # Remove existing copies of it.  We rebuild the list rather than removing
+    # entries while iterating over it, which would skip the entry after each
+    # one that is removed.
+    sys.path[:] = [pth for pth in sys.path if not _samefile(pth)]
 
     # Add it at the beginning.
     sys.path.insert(0, path)
 
 
+# Functions waiting to be parametrized by ParametrizingMetaclass, each mapped
+# to a list of (values, kwargs) pairs - one for every copy of the function.
+_PENDING: dict[Callable[..., Any], list[tuple[tuple[Any, ...], dict[str, Any]]]] = {}
+
+
 # We don't use the pytest parametrizing function, since it seems to break
 # with unittest.TestCase subclasses.
-def parametrize(field_names: tuple[str] | list[str] | str, field_values: list[Any] | Any) -> Callable[..., Any]:
+def parametrize(field_names: tuple[str, ...] | list[str] | str, field_values: list[Any] | Any) -> Callable[..., Any]:
     # If we're not given a list of field names, we make it.
     if not isinstance(field_names, (tuple, list)):
         field_names = (field_names,)
         field_values = [(val,) for val in field_values]
 
-    # Create a decorator that saves this list of field names and values on the
-    # function for later parametrizing.
+    # Build the keyword arguments for each copy of the function up front.
+    rows = []
+    for values in field_values:
+        assert len(field_names) == len(values)
+        rows.append((tuple(values), dict(zip(field_names, values))))
+
+    # Create a decorator that saves this list of values and keyword arguments
+    # for later parametrizing.
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        func.__dict__["param_names"] = field_names
-        func.__dict__["param_values"] = field_values
+        _PENDING[func] = rows
         return func
 
     return decorator
 
 
+# Every byte that isn't valid in an identifier, for use with bytes.translate().
+NON_IDENTIFIER_CHARS = bytes(c for c in range(256) if chr(c) not in string.ascii_letters + string.digits)
+
+
 # This is a metaclass that actually performs the parametrization.
 class ParametrizingMetaclass(type):
-    IDENTIFIER_RE = re.compile("[^A-Za-z0-9]")
-
     def __new__(klass, name: str, bases: tuple[type, ...], attrs: types.MappingProxyType[str, Any]) -> type:
+        # If nothing is parametrized, we can create the class as-is.
+        if not any(isinstance(attr, types.FunctionType) and attr in _PENDING for attr in attrs.values()):
+            return type.__new__(klass, name, bases, dict(attrs))
+
         new_attrs = attrs.copy()
         for attr_name, attr in attrs.items():
-            # We only care about functions
-            if not isinstance(attr, types.FunctionType):
-                continue
-
-            param_names = attr.__dict__.pop("param_names", None)
-            param_values = attr.__dict__.pop("param_values", None)
-            if param_names is None or param_values is None:
+            # We only care about functions that are waiting to be parametrized.
+            if not isinstance(attr, types.FunctionType) or attr not in _PENDING:
                 continue
 
             # Create multiple copies of the function.
-            for _, values in enumerate(param_values):
-                assert len(param_names) == len(values)
-
+            for values, kwargs in _PENDING.pop(attr):
                 # Get a repr of the values, and fix it to be a valid identifier
-                human = "_".join([klass.IDENTIFIER_RE.sub("", repr(x)) for x in values])
+                human = "_".join(
+                    [repr(x).encode("ascii", "ignore").translate(None, NON_IDENTIFIER_CHARS).decode() for x in values]
+                )
 
                 # Create a new name.
-                # new_name = attr.__name__ + "_%d" % i
                 new_name = attr.__name__ + "__" + human
 
-                # Create a replacement function.
-                def create_new_func(
-                    func: types.FunctionType, names: list[str], values: list[Any]
-                ) -> Callable[..., Any]:
-                    # Create a kwargs dictionary.
-                    kwargs = dict(zip(names, values))
-
-                    @functools.wraps(func)
-                    def new_func(self: types.FunctionType) -> Any:
-                        return func(self, **kwargs)
-
-                    # Manually set the name and return the new function.
-                    new_func.__name__ = new_name
-                    return new_func
-
-                # Actually create the new function.
-                new_func = create_new_func(attr, param_names, values)
+                # Create a replacement function, binding the function and its
+                # arguments as defaults.
+                def new_func(
+                    self: types.FunctionType, _func: types.FunctionType = attr, _kwargs: dict[str, Any] = kwargs
+                ) -> Any:
+                    return _func(self, **_kwargs)
+
+                # Copy over just the attributes we need, and set the name.
+                new_func.__name__ = new_name
+                new_func.__qualname__ = attr.__qualname__
+                new_func.__module__ = attr.__module__
+                new_func.__doc__ = attr.__doc__
 
                 # Save this new function in our attrs dict.
                 new_attrs[new_name] = new_func
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="run exhaustive sweeps that tests otherwise only sample"
+    )
+
+
+@pytest.fixture
+def run_slow(request: pytest.FixtureRequest) -> bool:
+    return bool(request.config.getoption("--run-slow"))
@@ -112,12 +112,32 @@ class TestField(unittest.TestCase):
         self.assertEqual(f.value, None)
 
 
+# One byte more than the MAX_MEMORY_FILE_SIZE of 10 used by the TestFile tests,
+# so that writing it forces the file to disk.
+oversized_payload = b"12345678901"
+
+
 class TestFile(unittest.TestCase):
+    tmp_dir: tempfile.TemporaryDirectory[str]
+    d: bytes
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # All tests share one upload directory, which is removed at the end.
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        cls.d = force_bytes(cls.tmp_dir.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.tmp_dir.cleanup()
+
     def setUp(self) -> None:
         self.c: FileConfig = {}
-        self.d = force_bytes(tempfile.mkdtemp())
         self.f = File(b"foo.txt", config=self.c)
 
+    def tearDown(self) -> None:
+        self.f.close()
+
     def assert_data(self, data: bytes) -> None:
         f = self.f.file_object
         f.seek(0)
@@ -175,7 +195,7 @@ class TestFile(unittest.TestCase):
         self.c["MAX_MEMORY_FILE_SIZE"] = 10
 
         # Write.
-        self.f.write(b"12345678901")
+        self.f.write(oversized_payload)
         self.assertFalse(self.f.in_memory)
 
         # Assert that the file exists
@@ -189,7 +209,7 @@ class TestFile(unittest.TestCase):
         self.c["MAX_MEMORY_FILE_SIZE"] = 10
 
         # Write.
-        self.f.write(b"12345678901")
+        self.f.write(oversized_payload)
         self.assertFalse(self.f.in_memory)
 
         # Assert that the file exists
@@ -203,7 +223,7 @@ class TestFile(unittest.TestCase):
         self.c["MAX_MEMORY_FILE_SIZE"] = 10
 
         # Write.
-        self.f.write(b"12345678901")
+        self.f.write(oversized_payload)
         self.assertFalse(self.f.in_memory)
 
         # Assert that the file exists
@@ -215,7 +235,7 @@ class TestFile(unittest.TestCase):
         self.c["MAX_MEMORY_FILE_SIZE"] = 10
 
         # Write.
-        self.f.write(b"12345678901")
+        self.f.write(oversized_payload)
         self.assertFalse(self.f.in_memory)
 
         # Assert that the file exists
@@ -325,8 +345,26 @@ class TestBaseParser(unittest.TestCase):
         self.b.callback("foo")  # type: ignore[arg-type]
         self.assertEqual(called, 1)
 
+    def test_data_callbacks(self) -> None:
+        chunks: list[bytes] = []
 
+        def on_foo(data: bytes, start: int, end: int) -> None:
+            chunks.append(data[start:end])
+
+        self.b.set_callback("foo", on_foo)  # type: ignore[arg-type]
+        self.b.callback("foo", b"foobar", 0, 3)  # type: ignore[arg-type]
+        self.b.callback("foo", b"foobar", 3, 3)  # type: ignore[arg-type]
+        self.assertEqual(chunks, [b"foo"])
+
+
+@parametrize_class
 class TestQuerystringParser(unittest.TestCase):
+    run_slow = False
+
+    @pytest.fixture(autouse=True)
+    def inject_run_slow(self, run_slow: bool) -> None:
+        self.run_slow = run_slow
+
     def assert_fields(self, *args: tuple[bytes, bytes], **kwargs: Any) -> None:
         if kwargs.pop("finalize", True):
             self.p.finalize()
@@ -340,25 +378,33 @@ class TestQuerystringParser(unittest.TestCase):
 
     def reset(self) -> None:
         self.f = []
+        # The chunks of the current field's name and data, kept as the
+        # (data, start, end) arguments of the callback, and only sliced out
+        # once the field has ended.
+        self.name_buffer: list[tuple[bytes, int, int]] = []
+        self.data_buffer: list[tuple[bytes, int, int]] = []
 
-        name_buffer: list[bytes] = []
-        data_buffer: list[bytes] = []
-
-        def on_field_name(data: bytes, start: int, end: int) -> None:
-            name_buffer.append(data[start:end])
+        self.p = QuerystringParser(
+            callbacks={
+                "on_field_name": self.on_field_name,
+                "on_field_data": self.on_field_data,
+                "on_field_end": self.on_field_end,
+            }
+        )
 
-        def on_field_data(data: bytes, start: int, end: int) -> None:
-            data_buffer.append(data[start:end])
+    def on_field_name(self, data: bytes, start: int, end: int) -> None:
+        self.name_buffer.append((data, start, end))
 
-        def on_field_end() -> None:
-            self.f.append((b"".join(name_buffer), b"".join(data_buffer)))
+    def on_field_data(self, data: bytes, start: int, end: int) -> None:
+        self.data_buffer.append((data, start, end))
 
-            del name_buffer[:]
-            del data_buffer[:]
+    def on_field_end(self) -> None:
+        name = b"".join([data[start:end] for data, start, end in self.name_buffer])
+        value = b"".join([data[start:end] for data, start, end in self.data_buffer])
+        self.f.append((name, value))
 
-        self.p = QuerystringParser(
-            callbacks={"on_field_name": on_field_name, "on_field_data": on_field_data, "on_field_end": on_field_end}
-        )
+        del self.name_buffer[:]
+        del self.data_buffer[:]
 
     def test_simple_querystring(self) -> None:
         self.p.write(b"foo=bar")
@@ -403,11 +449,46 @@ class TestQuerystringParser(unittest.TestCase):
         self.p.write(b"f=baz")
         self.assert_fields((b"asdf", b"baz"))
 
+    def test_streaming_name_without_value(self) -> None:
+        self.p.write(b"foo=bar&bla")
+        self.assert_fields((b"foo", b"bar"), finalize=False)
+
+        self.p.write(b"h&baz=qux")
+        self.assert_fields((b"blah", b""), (b"baz", b"qux"))
+
     def test_semicolon_separator(self) -> None:
         self.p.write(b"foo=bar;asdf=baz")
 
         self.assert_fields((b"foo", b"bar"), (b"asdf", b"baz"))
 
+    def test_mixed_separators(self) -> None:
+        # Fields are split at the next ampersand; a semicolon only separates
+        # fields once there are no ampersands left in the chunk.
+        self.p.strict_parsing = True
+        self.p.write(b"q=x;admin=1&z=2;y=3")
+
+        self.assert_fields((b"q", b"x;admin=1"), (b"z", b"2"), (b"y", b"3"))
+
+    @parametrize(
+        ("data", "fields"),
+        [
+            (b"q=x;admin=1&z=2;y=3", [(b"q", b"x;admin=1"), (b"z", b"2"), (b"y", b"3")]),
+            (b"foo=bar;asdf=baz&name;other=value", [(b"foo", b"bar;asdf=baz"), (b"name", b""), (b"other", b"value")]),
+            (b"a=1;&b=2", [(b"a", b"1;"), (b"b", b"2")]),
+        ],
+    )
+    def test_mixed_separators_chunked(self, data: bytes, fields: list[tuple[bytes, bytes]]) -> None:
+        # Written in one go, the complete fields are tokenized by a regular
+        # expression; writing the first byte on its own leaves all of them to
+        # the state machine.  Both have to split the fields the same way.
+        self.p.write(data)
+        self.assert_fields(*fields)
+
+        self.reset()
+        self.p.write(data[:1])
+        self.p.write(data[1:])
+        self.assert_fields(*fields)
+
     def test_too_large_field(self) -> None:
         self.p.max_size = 15
 
@@ -423,9 +504,14 @@ class TestQuerystringParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             p = QuerystringParser(max_size=-100)
 
+    def test_nan_max_size(self) -> None:
+        self.p.max_size = float("nan")
+        self.p.write(b"foo=bar&asdf=baz")
+        self.assert_fields((b"foo", b"bar"), (b"asdf", b"baz"))
+
     def test_strict_parsing_pass(self) -> None:
         data = b"foo=bar&another=asdf"
-        for first, last in split_all(data):
+        for first, last in split_all(data) if self.run_slow else split_some(data):
             self.reset()
             self.p.strict_parsing = True
 
@@ -454,7 +540,7 @@ class TestQuerystringParser(unittest.TestCase):
 
     def test_double_sep(self) -> None:
         data = b"foo=bar&&another=asdf"
-        for first, last in split_all(data):
+        for first, last in split_all(data) if self.run_slow else split_some(data):
             print(f" {first!r} / {last!r} ")
             self.reset()
 
@@ -487,16 +573,18 @@ class TestOctetStreamParser(unittest.TestCase):
         self.started = 0
         self.finished = 0
 
-        def on_start() -> None:
-            self.started += 1
+        self.p = OctetStreamParser(
+            callbacks={"on_start": self.on_start, "on_data": self.on_data, "on_end": self.on_end}
+        )
 
-        def on_data(data: bytes, start: int, end: int) -> None:
-            self.d.append(data[start:end])
+    def on_start(self) -> None:
+        self.started += 1
 
-        def on_end() -> None:
-            self.finished += 1
+    def on_data(self, data: bytes, start: int, end: int) -> None:
+        self.d.append(data[start:end])
 
-        self.p = OctetStreamParser(callbacks={"on_start": on_start, "on_data": on_data, "on_end": on_end})
+    def on_end(self) -> None:
+        self.finished += 1
 
     def assert_data(self, data: bytes, finalize: bool = True) -> None:
         self.assertEqual(b"".join(self.d), data)
@@ -551,18 +639,40 @@ class TestOctetStreamParser(unittest.TestCase):
             q = OctetStreamParser(max_size="foo")  # type: ignore[arg-type]
 
 
+class _CountingStub:
+    """An underlying object for the decoders that counts calls passed through to it."""
+
+    def __init__(self) -> None:
+        self.finalize_calls = 0
+        self.close_calls = 0
+
+    def write(self, data: bytes) -> int:
+        return len(data)
+
+    def finalize(self) -> None:
+        self.finalize_calls += 1
+
+    def close(self) -> None:
+        self.close_calls += 1
+
+
 class TestBase64Decoder(unittest.TestCase):
     # Note: base64('foobar') == 'Zm9vYmFy'
     def setUp(self) -> None:
         self.f = BytesIO()
         self.d = Base64Decoder(self.f)
 
+    def _reset(self) -> None:
+        # Empty our output and start again with a fresh decoder.
+        self.f.seek(0)
+        self.f.truncate()
+        self.d = Base64Decoder(self.f)
+
     def assert_data(self, data: bytes, finalize: bool = True) -> None:
         if finalize:
             self.d.finalize()
 
-        self.f.seek(0)
-        self.assertEqual(self.f.read(), data)
+        self.assertEqual(self.f.getvalue(), data)
         self.f.seek(0)
         self.f.truncate()
 
@@ -584,7 +694,7 @@ class TestBase64Decoder(unittest.TestCase):
         for i in range(1, 4):
             first, second = buff[:i], buff[i:]
 
-            self.setUp()
+            self._reset()
             self.d.write(first)
             self.d.write(second)
             self.assert_data(b"foo")
@@ -594,20 +704,25 @@ class TestBase64Decoder(unittest.TestCase):
         for i in range(5, 8):
             first, second = buff[:i], buff[i:]
 
-            self.setUp()
+            self._reset()
             self.d.write(first)
             self.d.write(second)
             self.assert_data(b"foobar")
 
+    def test_memoryview(self) -> None:
+        self.d.write(memoryview(b"Zm9vYm"))
+        self.d.write(memoryview(b"Fy"))
+        self.assert_data(b"foobar")
+
     def test_close_and_finalize(self) -> None:
-        parser = Mock()
-        f = Base64Decoder(parser)
+        stub = _CountingStub()
+        f = Base64Decoder(stub)
 
         f.finalize()
-        parser.finalize.assert_called_once_with()
+        self.assertEqual(stub.finalize_calls, 1)
 
         f.close()
-        parser.close.assert_called_once_with()
+        self.assertEqual(stub.close_calls, 1)
 
     def test_bad_length(self) -> None:
         self.d.write(b"Zm9vYmF")  # missing ending 'y'
@@ -625,8 +740,7 @@ class TestQuotedPrintableDecoder(unittest.TestCase):
         if finalize:
             self.d.finalize()
 
-        self.f.seek(0)
-        self.assertEqual(self.f.read(), data)
+        self.assertEqual(self.f.getvalue(), data)
         self.f.seek(0)
         self.f.truncate()
 
@@ -661,15 +775,20 @@ class TestQuotedPrintableDecoder(unittest.TestCase):
         self.d.write(b"\r\nbar")
         self.assert_data(b"foobar")
 
+    def test_memoryview(self) -> None:
+        self.d.write(memoryview(b"foo=3"))
+        self.d.write(memoryview(b"Dbar"))
+        self.assert_data(b"foo=bar")
+
     def test_close_and_finalize(self) -> None:
-        parser = Mock()
-        f = QuotedPrintableDecoder(parser)
+        stub = _CountingStub()
+        f = QuotedPrintableDecoder(stub)
 
         f.finalize()
-        parser.finalize.assert_called_once_with()
+        self.assertEqual(stub.finalize_calls, 1)
 
         f.close()
-        parser.close.assert_called_once_with()
+        self.assertEqual(stub.close_calls, 1)
 
     def test_not_aligned(self) -> None:
         """
@@ -690,27 +809,35 @@ class TestQuotedPrintableDecoder(unittest.TestCase):
 # Load our list of HTTP test cases.
 http_tests_dir = os.path.join(curr_dir, "test_data", "http")
 
+# Use libyaml's much faster loader to read the expected results, if PyYAML was
+# built with it.
+yaml_loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Read in all test cases and load them.
 NON_PARAMETRIZED_TESTS = {"single_field_blocks"}
+http_test_paths: dict[str, str] = {}
 http_tests: list[TestParams] = []
+# The contents of every HTTP test case, keyed by name.
+http_test_bytes: dict[str, bytes] = {}
 for f in os.listdir(http_tests_dir):
     # Only load the HTTP test cases.
     fname, ext = os.path.splitext(f)
-    if fname in NON_PARAMETRIZED_TESTS:
+    if ext != ".http":
         continue
 
-    if ext == ".http":
-        # Get the YAML file and load it too.
-        yaml_file = os.path.join(http_tests_dir, fname + ".yaml")
+    http_test_paths[fname] = os.path.join(http_tests_dir, f)
+    with open(http_test_paths[fname], "rb") as fh:
+        test_data = fh.read()
+    http_test_bytes[fname] = test_data
 
-        # Load both.
-        with open(os.path.join(http_tests_dir, f), "rb") as fh:
-            test_data = fh.read()
+    if fname in NON_PARAMETRIZED_TESTS:
+        continue
 
-        with open(yaml_file, "rb") as fy:
-            yaml_data = yaml.safe_load(fy)
+    # Get the YAML file and load it too.
+    with open(os.path.join(http_tests_dir, fname + ".yaml"), "rb") as fy:
+        yaml_data = yaml.load(fy, Loader=yaml_loader)
 
-        http_tests.append({"name": fname, "test": test_data, "result": yaml_data})
+    http_tests.append({"name": fname, "test": test_data, "result": yaml_data})
 
 # Datasets used for single-byte writing test.
 single_byte_tests = [
@@ -722,6 +849,21 @@ single_byte_tests = [
 ]
 
 
+# Chunk sizes (c) and offsets (d) used for the block writing test.  Rather
+# than trying every chunk size and offset, try a few small sizes, sizes around
+# the length of the boundary (b"\r\n--boundary"), and a few large ones, each
+# at a few offsets.
+def _feed_blocks_params() -> list[tuple[int, int]]:
+    data_length = len(http_test_bytes["single_field_blocks"])
+    boundary_length = len(b"\r\n--boundary")
+    sizes = {1, 2, 3, 4, 8, 16, 32, 64, data_length // 2, data_length - 1, data_length}
+    sizes.update(range(boundary_length - 2, boundary_length + 3))
+    return [(c, d) for c in sorted(sizes) for d in sorted({0, 1, c // 2, c - 1} & set(range(c)))]
+
+
+feed_blocks_params = _feed_blocks_params()
+
+
 def split_all(val: bytes) -> Iterator[tuple[bytes, bytes]]:
     """
     This function will split an array all possible ways.  For example:
@@ -733,6 +875,62 @@ def split_all(val: bytes) -> Iterator[tuple[bytes, bytes]]:
         yield (val[:i], val[i:])
 
 
+def split_some(val: bytes) -> Iterator[tuple[bytes, bytes]]:
+    """
+    Like split_all(), but only splits after the first byte, in the middle and
+    before the last byte.  Pass --run-slow to pytest to try every split.
+    """
+    for i in sorted({1, len(val) // 2, len(val) - 2}):
+        yield (val[:i], val[i:])
+
+
+class KeepingFile(File):
+    """A custom file class that holds on to every chunk it's given."""
+
+    def __init__(self, file_name: bytes | None, field_name: bytes | None = None, config: FileConfig = {}) -> None:
+        super().__init__(file_name, field_name, config)
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes | memoryview) -> int:
+        self.chunks.append(cast(bytes, data))
+        return super().write(data)
+
+
+# The random data fuzz test runs this many seeded batches of iterations, so
+# that a failing batch can be rerun on its own.
+fuzz_batches = 20
+fuzz_batch_size = 50
+
+
+def _fuzz_mutations(data: bytes, size: int = 100) -> list[tuple[int, int, int]]:
+    """
+    Build a fixed list of (mutation, offset, byte) entries for
+    test_request_body_fuzz.  Every mutation is tried at the start, middle and
+    end of the data, and next to each boundary, CR, LF and header colon; the
+    rest of the list is filled with random mutations from a fixed seed.
+    """
+    rng = random.Random(0)
+    offsets = {0, len(data) // 2, len(data) - 2}
+    offsets.update(i for i, c in enumerate(data) if c in b"\r\n:")
+    offsets.update(i for i in range(len(data)) if data.startswith(b"--boundary", i))
+
+    # Swaps need a second byte after the offset.
+    mutations = [
+        (choice, offset, rng.randrange(256))
+        for offset in sorted(offsets)
+        for choice in (1, 2, 3)
+        if offset < len(data) - (choice == 3)
+    ]
+    while len(mutations) < size:
+        choice = rng.choice((1, 2, 3))
+        mutations.append((choice, rng.randrange(len(data) - (choice == 3)), rng.randrange(256)))
+
+    return mutations
+
+
+fuzz_mutations = _fuzz_mutations(http_test_bytes["single_field_single_file"])
+
+
 @parametrize_class
 class TestFormParser(unittest.TestCase):
     def make(self, boundary: str | bytes, config: dict[str, Any] = {}) -> None:
@@ -740,17 +938,19 @@ class TestFormParser(unittest.TestCase):
         self.files: list[File] = []
         self.fields: list[Field] = []
 
-        def on_field(f: FieldProtocol) -> None:
-            self.fields.append(cast(Field, f))
+        # Get a form-parser instance.
+        self.f = FormParser(
+            "multipart/form-data", self.on_field, self.on_file, self.on_end, boundary=boundary, config=config
+        )
 
-        def on_file(f: FileProtocol) -> None:
-            self.files.append(cast(File, f))
+    def on_field(self, f: FieldProtocol) -> None:
+        self.fields.append(cast(Field, f))
 
-        def on_end() -> None:
-            self.ended = True
+    def on_file(self, f: FileProtocol) -> None:
+        self.files.append(cast(File, f))
 
-        # Get a form-parser instance.
-        self.f = FormParser("multipart/form-data", on_field, on_file, on_end, boundary=boundary, config=config)
+    def on_end(self) -> None:
+        self.ended = True
 
     def assert_file_data(self, f: File, data: bytes) -> None:
         o = f.file_object
@@ -850,9 +1050,7 @@ class TestFormParser(unittest.TestCase):
         through every possible split.
         """
         # Load test data.
-        test_file = "single_field_single_file.http"
-        with open(os.path.join(http_tests_dir, test_file), "rb") as f:
-            test_data = f.read()
+        test_data = http_test_bytes["single_field_single_file"]
 
         # We split the file through all cases.
         for first, last in split_all(test_data):
@@ -878,10 +1076,8 @@ class TestFormParser(unittest.TestCase):
         This test parses multipart bodies 1 byte at a time.
         """
         # Load test data.
-        test_file = param["name"] + ".http"
         boundary = param["result"]["boundary"]
-        with open(os.path.join(http_tests_dir, test_file), "rb") as f:
-            test_data = f.read()
+        test_data = http_test_bytes[param["name"]]
 
         # Create form parser.
         self.make(boundary)
@@ -914,100 +1110,97 @@ class TestFormParser(unittest.TestCase):
             else:
                 assert False
 
-    def test_feed_blocks(self) -> None:
+    @parametrize(("c", "d"), feed_blocks_params)
+    def test_feed_blocks(self, c: int, d: int) -> None:
         """
-        This test parses a simple multipart body 1 byte at a time.
+        This test parses a simple multipart body in blocks of `c` bytes, after
+        writing the first `d` bytes on their own.
         """
         # Load test data.
-        test_file = "single_field_blocks.http"
-        with open(os.path.join(http_tests_dir, test_file), "rb") as f:
-            test_data = f.read()
-
-        for c in range(1, len(test_data) + 1):
-            # Skip first `d` bytes - not interesting
-            for d in range(c):
-                # Create form parser.
-                self.make("boundary")
-                # Skip
-                i = 0
-                self.f.write(test_data[:d])
-                i += d
-                for x in range(d, len(test_data), c):
-                    # Write a chunk to achieve condition
-                    #     `i == data_length - 1`
-                    # in boundary search loop (multipatr.py:1302)
-                    b = test_data[x : x + c]
-                    i += self.f.write(b)
+        test_data = http_test_bytes["single_field_blocks"]
 
-                self.f.finalize()
+        # Create form parser.
+        self.make("boundary")
+        # Skip
+        i = 0
+        self.f.write(test_data[:d])
+        i += d
+        for x in range(d, len(test_data), c):
+            # Write the next chunk.  The sampled (c, d) pairs make chunks end
+            # part-way through a boundary, so that partial boundaries are split
+            # across writes.
+            b = test_data[x : x + c]
+            i += self.f.write(b)
+
+        self.f.finalize()
 
-                # Assert we processed everything.
-                self.assertEqual(i, len(test_data))
+        # Assert we processed everything.
+        self.assertEqual(i, len(test_data))
 
-                # Assert that our field is here.
-                self.assert_field(b"field", b"0123456789ABCDEFGHIJ0123456789ABCDEFGHIJ")
+        # Assert that our field is here.
+        self.assert_field(b"field", b"0123456789ABCDEFGHIJ0123456789ABCDEFGHIJ")
 
     def test_request_body_fuzz(self) -> None:
         """
-        This test randomly fuzzes the request body to ensure that no strange
+        This test fuzzes the request body to ensure that no strange
         exceptions are raised and we don't end up in a strange state.  The
-        fuzzing consists of randomly doing one of the following:
-            - Adding a random byte at a random offset
-            - Randomly deleting a single byte
-            - Randomly swapping two bytes
+        fuzzing consists of doing one of the following for every entry in
+        fuzz_mutations:
+            - Adding a random byte at an offset
+            - Deleting a single byte
+            - Swapping two bytes
         """
         # Load test data.
-        test_file = "single_field_single_file.http"
-        with open(os.path.join(http_tests_dir, test_file), "rb") as f:
-            test_data = f.read()
+        test_data = http_test_bytes["single_field_single_file"]
 
-        iterations = 1000
         successes = 0
         failures = 0
         exceptions = 0
 
-        print("Running %d iterations of fuzz testing:" % (iterations,))
-        for i in range(iterations):
-            # Create a bytearray to mutate.
-            fuzz_data = bytearray(test_data)
+        # Create form parser, which is reset for every iteration.
+        self.make("boundary")
+
+        # Every iteration copies the request into this one bytearray and mutates
+        # it in place, reusing its memory rather than allocating a new buffer.
+        fuzz_data = bytearray(len(test_data) + 1)
+
+        print("Running %d iterations of fuzz testing:" % (len(fuzz_mutations),))
+        for choice, offset, b in fuzz_mutations:
+            fuzz_data[:] = test_data
 
-            # Pick what we're supposed to do.
-            choice = random.choice([1, 2, 3])
+            # Only the message's arguments are saved here; it's formatted if
+            # the parser crashes.
+            msg_args: tuple[int, ...]
             if choice == 1:
                 # Add a random byte.
-                i = random.randrange(len(test_data))
-                b = random.randrange(256)
-
-                fuzz_data.insert(i, b)
-                msg = "Inserting byte %r at offset %d" % (b, i)
+                fuzz_data.insert(offset, b)
+                msg, msg_args = "Inserting byte %r at offset %d", (b, offset)
 
             elif choice == 2:
                 # Remove a random byte.
-                i = random.randrange(len(test_data))
-                del fuzz_data[i]
+                del fuzz_data[offset]
 
-                msg = "Deleting byte at offset %d" % (i,)
+                msg, msg_args = "Deleting byte at offset %d", (offset,)
 
             elif choice == 3:
                 # Swap two bytes.
-                i = random.randrange(len(test_data) - 1)
-                fuzz_data[i], fuzz_data[i + 1] = fuzz_data[i + 1], fuzz_data[i]
-
-                msg = "Swapping bytes %d and %d" % (i, i + 1)
+                fuzz_data[offset], fuzz_data[offset + 1] = fuzz_data[offset + 1], fuzz_data[offset]
 
-            # Print message, so if this crashes, we can inspect the output.
-            print("  " + msg)
+                msg, msg_args = "Swapping bytes %d and %d", (offset, offset + 1)
 
-            # Create form parser.
-            self.make("boundary")
+            self.f.reset()
 
             # Feed with data, and ignore form parser exceptions.
             i = 0
             try:
-                i = self.f.write(bytes(fuzz_data))
+                i = self.f.write(cast(bytes, fuzz_data))
                 self.f.finalize()
             except FormParserError:
                 exceptions += 1
+            except Exception:
+                # Print the mutation, so if this crashes, we can inspect the output.
+                print("  " + msg % msg_args)
+                raise
             else:
                 if i == len(fuzz_data):
                     successes += 1
@@ -1019,32 +1212,45 @@ class TestFormParser(unittest.TestCase):
         print("Failures:   %d" % (failures,))
         print("Exceptions: %d" % (exceptions,))
 
-    def test_request_body_fuzz_random_data(self) -> None:
+    @parametrize("seed", range(fuzz_batches))
+    def test_request_body_fuzz_random_data(self, seed: int) -> None:
         """
         This test will fuzz the multipart parser with some number of iterations
         of randomly-generated data.
         """
-        iterations = 1000
+        iterations = fuzz_batch_size
         successes = 0
         failures = 0
         exceptions = 0
 
+        # Generate all of the random data we need at once, and hand out a
+        # different slice of it for every iteration.
+        rng = random.Random(seed)
+        data_sizes = [rng.randrange(100, 4096) for _ in range(iterations)]
+        random_data = rng.getrandbits(8 * sum(data_sizes)).to_bytes(sum(data_sizes), "little")
+        start = 0
+
+        # Create form parser, which is reset for every iteration.
+        self.make("boundary")
+
         print("Running %d iterations of fuzz testing:" % (iterations,))
-        for i in range(iterations):
-            data_size = random.randrange(100, 4096)
-            data = os.urandom(data_size)
-            print("  Testing with %d random bytes..." % (data_size,))
+        for data_size in data_sizes:
+            data = random_data[start : start + data_size]
+            start += data_size
 
-            # Create form parser.
-            self.make("boundary")
+            self.f.reset()
 
             # Feed with data, and ignore form parser exceptions.
             i = 0
             try:
-                i = self.f.write(bytes(data))
+                i = self.f.write(data)
                 self.f.finalize()
             except FormParserError:
                 exceptions += 1
+            except Exception:
+                # Print the data, so if this crashes, we can inspect the output.
+                print("  Seed %d: testing with %d random bytes: %r" % (seed, data_size, data))
+                raise
             else:
                 if i == len(data):
                     successes += 1
@@ -1056,6 +1262,66 @@ class TestFormParser(unittest.TestCase):
         print("Failures:   %d" % (failures,))
         print("Exceptions: %d" % (exceptions,))
 
+    def test_reset(self) -> None:
+        """Resetting a parser part-way through a body lets it parse a new body."""
+        multipart_data = http_test_bytes["single_field_single_file"]
+        cases: list[tuple[str, bytes, bytes]] = [
+            ("application/octet-stream", b"foo", b"bar"),
+            ("application/x-www-form-urlencoded", b"foo=ba", b"a=b"),
+            # Stop part-way through the file, after the field has been parsed.
+            ("multipart/form-data", multipart_data[: multipart_data.index(b"test2") + 2], multipart_data),
+        ]
+        for content_type, partial, data in cases:
+            with self.subTest(content_type=content_type):
+                fields: list[Field] = []
+                files: list[File] = []
+                closed: list[object] = []
+
+                class ClosingFile(File):
+                    def close(self) -> None:
+                        closed.append(self)
+                        super().close()
+
+                class ClosingField(Field):
+                    def close(self) -> None:
+                        closed.append(self)
+                        super().close()
+
+                def on_field(f: FieldProtocol) -> None:
+                    fields.append(cast(Field, f))
+
+                def on_file(f: FileProtocol) -> None:
+                    files.append(cast(File, f))
+
+                f = FormParser(
+                    content_type, on_field, on_file, boundary="boundary", FileClass=ClosingFile, FieldClass=ClosingField
+                )
+                f.write(partial)
+                delivered = fields + files
+                f.reset()
+
+                # Only the field or file that was still being parsed is
+                # closed; anything already handed to us is left alone.
+                self.assertEqual(len(closed), 1)
+                self.assertNotIn(closed[0], delivered)
+                del fields[:], files[:]
+
+                self.assertEqual(f.write(data), len(data))
+                f.finalize()
+
+                if content_type == "application/octet-stream":
+                    self.assertEqual(fields, [])
+                    self.assertEqual(len(files), 1)
+                    self.assert_file_data(files[0], b"bar")
+                elif content_type == "application/x-www-form-urlencoded":
+                    self.assertEqual([(field.field_name, field.value) for field in fields], [(b"a", b"b")])
+                    self.assertEqual(files, [])
+                else:
+                    self.assertEqual(len(delivered), 1)
+                    self.assertEqual([(field.field_name, field.value) for field in fields], [(b"field", b"test1")])
+                    self.assertEqual([file.file_name for file in files], [b"file.txt"])
+                    self.assert_file_data(files[0], b"test2")
+
     def test_bad_start_boundary(self) -> None:
         self.make("boundary")
         data = b"--boundary\rfoobar"
@@ -1094,6 +1360,43 @@ class TestFormParser(unittest.TestCase):
         self.assert_file_data(files[0], b"test1234")
         self.assertTrue(on_end.called)
 
+    def test_octet_stream_custom_file_class(self) -> None:
+        files: list[KeepingFile] = []
+
+        def on_file(f: FileProtocol) -> None:
+            files.append(cast(KeepingFile, f))
+
+        f = FormParser("application/octet-stream", None, on_file, file_name=b"foo.txt", FileClass=KeepingFile)
+
+        # Custom file classes get their own copy of the data, so reusing the
+        # buffer we write from doesn't change what they kept.
+        buffer = bytearray(b"hello")
+        f.write(cast(bytes, buffer))
+        buffer[:] = b"XXXXX"
+        f.finalize()
+
+        self.assertEqual(len(files), 1)
+        self.assertEqual(files[0].chunks, [b"hello"])
+
+    def test_multipart_custom_file_class(self) -> None:
+        files: list[KeepingFile] = []
+
+        def on_file(f: FileProtocol) -> None:
+            files.append(cast(KeepingFile, f))
+
+        f = FormParser("multipart/form-data", None, on_file, boundary="boundary", FileClass=KeepingFile)
+
+        # Custom file classes get their own copy of the data, so reusing the
+        # buffer we write from doesn't change what they kept.
+        buffer = bytearray(http_test_bytes["single_field_single_file"])
+        f.write(cast(bytes, buffer))
+        buffer[:] = b"X" * len(buffer)
+        f.finalize()
+
+        self.assertEqual(len(files), 1)
+        self.assertEqual(files[0].chunks, [b"test2"])
+        self.assertEqual(files[0].chunks[0].decode("ascii"), "test2")
+
     def test_querystring(self) -> None:
         fields: list[Field] = []
 
@@ -1216,11 +1519,11 @@ class TestFormParser(unittest.TestCase):
         """This test makes sure that the parser does not handle when there is junk data after the last boundary."""
         num = 5_000_000
         data = (
-            "\r\n" * num + "--boundary\r\n"
-            'Content-Disposition: form-data; name="file"; filename="filename.txt"\r\n'
-            "Content-Type: text/plain\r\n\r\n"
-            "hello\r\n"
-            "--boundary--"
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="filename.txt"\r\n'
+            b"Content-Type: text/plain\r\n\r\n"
+            b"hello\r\n"
+            b"--boundary--"
         )
 
         files: list[File] = []
@@ -1229,17 +1532,44 @@ class TestFormParser(unittest.TestCase):
             files.append(cast(File, f))
 
         f = FormParser("multipart/form-data", on_field=Mock(), on_file=on_file, boundary="boundary")
-        f.write(data.encode("latin-1"))
+
+        # Stream the newlines in 64 KiB chunks rather than building them all up front.
+        chunk_newlines = 32768
+        chunk = b"\r\n" * chunk_newlines
+        for _ in range(num // chunk_newlines):
+            f.write(chunk)
+        f.write(b"\r\n" * (num % chunk_newlines) + data)
+
+    def test_multipart_parser_newlines_in_own_chunk(self) -> None:
+        """This test makes sure that leading newlines can arrive separately from the first boundary."""
+        files: list[File] = []
+
+        def on_file(f: FileProtocol) -> None:
+            files.append(cast(File, f))
+
+        f = FormParser("multipart/form-data", on_field=Mock(), on_file=on_file, boundary="boundary")
+        f.write(b"\r\n\r\n")
+        f.write(
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="filename.txt"\r\n'
+            b"Content-Type: text/plain\r\n\r\n"
+            b"hello\r\n"
+            b"--boundary--"
+        )
+        f.finalize()
+
+        self.assertEqual(len(files), 1)
+        self.assertEqual(files[0].size, 5)
 
     def test_multipart_parser_data_after_last_boundary(self) -> None:
         """This test makes sure that the parser does not handle when there is junk data after the last boundary."""
         num = 50_000_000
         data = (
-            "--boundary\r\n"
-            'Content-Disposition: form-data; name="file"; filename="filename.txt"\r\n'
-            "Content-Type: text/plain\r\n\r\n"
-            "hello\r\n"
-            "--boundary--" + "-" * num + "\r\n"
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="filename.txt"\r\n'
+            b"Content-Type: text/plain\r\n\r\n"
+            b"hello\r\n"
+            b"--boundary--"
         )
 
         files: list[File] = []
@@ -1248,7 +1578,14 @@ class TestFormParser(unittest.TestCase):
             files.append(cast(File, f))
 
         f = FormParser("multipart/form-data", on_field=Mock(), on_file=on_file, boundary="boundary")
-        f.write(data.encode("latin-1"))
+        f.write(data)
+
+        # Stream the junk in 64 KiB chunks rather than building it all up front.
+        chunk_size = 65536
+        chunk = b"-" * chunk_size
+        for _ in range(num // chunk_size):
+            f.write(chunk)
+        f.write(b"-" * (num % chunk_size) + b"\r\n")
 
     @pytest.fixture(autouse=True)
     def inject_fixtures(self, caplog: pytest.LogCaptureFixture) -> None:
@@ -1276,9 +1613,7 @@ class TestFormParser(unittest.TestCase):
 
     def test_max_size_multipart(self) -> None:
         # Load test data.
-        test_file = "single_field_single_file.http"
-        with open(os.path.join(http_tests_dir, test_file), "rb") as f:
-            test_data = f.read()
+        test_data = http_test_bytes["single_field_single_file"]
 
         # Create form parser.
         self.make("boundary")
@@ -1286,30 +1621,28 @@ class TestFormParser(unittest.TestCase):
         # Set the maximum length that we can process to be halfway through the
         # given data.
         assert self.f.parser is not None
-        self.f.parser.max_size = float(len(test_data)) / 2
+        self.f.parser.max_size = len(test_data) // 2
 
         i = self.f.write(test_data)
         self.f.finalize()
 
         # Assert we processed the correct amount.
-        self.assertEqual(i, len(test_data) / 2)
+        self.assertEqual(i, len(test_data) // 2)
 
     def test_max_size_form_parser(self) -> None:
         # Load test data.
-        test_file = "single_field_single_file.http"
-        with open(os.path.join(http_tests_dir, test_file), "rb") as f:
-            test_data = f.read()
+        test_data = http_test_bytes["single_field_single_file"]
 
         # Create form parser setting the maximum length that we can process to
         # be halfway through the given data.
-        size = len(test_data) / 2
+        size = len(test_data) // 2
         self.make("boundary", config={"MAX_BODY_SIZE": size})
 
         i = self.f.write(test_data)
         self.f.finalize()
 
         # Assert we processed the correct amount.
-        self.assertEqual(i, len(test_data) / 2)
+        self.assertEqual(i, len(test_data) // 2)
 
     def test_octet_stream_max_size(self) -> None:
         files: list[File] = []
@@ -1344,9 +1677,7 @@ class TestFormParser(unittest.TestCase):
         See GitHub issue #23
         """
         # Load test data.
-        test_file = "single_field_single_file.http"
-        with open(os.path.join(http_tests_dir, test_file), "rb") as f:
-            test_data = f.read()
+        test_data = http_test_bytes["single_field_single_file"]
 
         calls = 0
 
@@ -1367,6 +1698,22 @@ class TestFormParser(unittest.TestCase):
         # for each header in the multipart message.
         self.assertEqual(calls, 3)
 
+    def test_cr_near_end_of_chunk(self) -> None:
+        # A CR close to the end of a chunk that isn't the start of a boundary
+        # must be passed on as part data.
+        part_data = b""
+
+        def on_part_data(data: bytes, start: int, end: int) -> None:
+            nonlocal part_data
+            part_data += data[start:end]
+
+        parser = MultipartParser("boundary", callbacks={"on_part_data": on_part_data})
+        parser.write(b'--boundary\r\nContent-Disposition: form-data; name="a"\r\n\r\nfoo\rbar')
+        parser.write(b"\r\n--boundary--\r\n")
+        parser.finalize()
+
+        self.assertEqual(part_data, b"foo\rbar")
+
 
 class TestHelperFunctions(unittest.TestCase):
     def test_create_form_parser(self) -> None:
@@ -1390,6 +1737,35 @@ class TestHelperFunctions(unittest.TestCase):
         # 15 - i.e. all data is written.
         self.assertEqual(on_file.call_args[0][0].size, 15)
 
+    def test_parse_form_urlencoded(self) -> None:
+        fields: list[Field] = []
+
+        def on_field(field: FieldProtocol) -> None:
+            fields.append(cast(Field, field))
+
+        parse_form({"Content-Type": b"application/x-www-form-urlencoded"}, BytesIO(b"foo=bar&baz=qux"), on_field, None)
+
+        self.assertEqual([(f.field_name, f.value) for f in fields], [(b"foo", b"bar"), (b"baz", b"qux")])
+
+    def test_parse_form_lowercase_headers(self) -> None:
+        files: list[FileProtocol] = []
+
+        def on_field(field: FieldProtocol) -> None:
+            pass
+
+        def on_file(file: FileProtocol) -> None:
+            files.append(file)
+
+        parse_form(
+            {"content-type": b"application/octet-stream", "content-length": b"10"},
+            BytesIO(b"123456789012345"),
+            on_field,
+            on_file,
+        )
+
+        self.assertEqual(len(files), 1)
+        self.assertEqual(files[0].size, 10)  # type: ignore[attr-defined]
+
     def test_parse_form_content_length(self) -> None:
         files: list[FileProtocol] = []
 
@@ -1409,17 +1785,64 @@ class TestHelperFunctions(unittest.TestCase):
         self.assertEqual(len(files), 1)
         self.assertEqual(files[0].size, 10)  # type: ignore[attr-defined]
 
+    def test_parse_form_without_readinto(self) -> None:
+        class Stream:
+            def __init__(self, data: bytes) -> None:
+                self.stream = BytesIO(data)
+
+            def read(self, n: int) -> bytes:
+                return self.stream.read(n)
+
+        files: list[FileProtocol] = []
+
+        def on_field(field: FieldProtocol) -> None:
+            pass
+
+        def on_file(file: FileProtocol) -> None:
+            files.append(file)
+
+        parse_form(
+            {"Content-Type": b"application/octet-stream"}, Stream(b"123456789012345"), on_field, on_file, chunk_size=4
+        )
+
+        self.assertEqual(len(files), 1)
+        self.assertEqual(files[0].size, 15)  # type: ignore[attr-defined]
+
+    def test_parse_form_short_reads(self) -> None:
+        # Streams that return fewer bytes than requested, without being at the
+        # end of the stream yet.
+        class ReadStream:
+            def __init__(self, data: bytes) -> None:
+                self.stream = BytesIO(data)
+
+            def read(self, n: int) -> bytes:
+                return self.stream.read(min(n, 3))
+
+        class ReadIntoStream(ReadStream):
+            def readinto(self, b: memoryview) -> int:
+                return self.stream.readinto(b[:3])
+
+        for stream_class in (ReadStream, ReadIntoStream):
+            for headers in (
+                {"Content-Type": b"application/octet-stream"},
+                {"Content-Type": b"application/octet-stream", "Content-Length": b"15"},
+            ):
+                with self.subTest(stream_class=stream_class, headers=headers):
+                    files: list[FileProtocol] = []
+
+                    def on_field(field: FieldProtocol) -> None:
+                        pass
+
+                    def on_file(file: FileProtocol) -> None:
+                        files.append(file)
+
+                    parse_form(headers, stream_class(b"123456789012345"), on_field, on_file, chunk_size=4)
+
+                    self.assertEqual(len(files), 1)
+                    self.assertEqual(files[0].size, 15)  # type: ignore[attr-defined]
+
 
 def suite() -> unittest.TestSuite:
-    suite = unittest.TestSuite()
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestFile))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestParseOptionsHeader))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestBaseParser))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestQuerystringParser))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestOctetStreamParser))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestBase64Decoder))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestQuotedPrintableDecoder))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestFormParser))
-    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(TestHelperFunctions))
-
-    return suite
+    # Picks up every unittest.TestCase subclass in this module, so every test
+    # class here has to be one to be included.
+    return unittest.defaultTestLoader.loadTestsFromModule(sys.modules[__name__])